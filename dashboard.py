@@ -6,22 +6,60 @@ Real-time view of renewable electricity in Germany
 import streamlit as st
 import os
 import requests
-import time
-import xml.etree.ElementTree as ET
 import holidays
-from datetime import datetime, timedelta
+import numpy as np
+import orjson
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from dotenv import load_dotenv
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 load_dotenv()
 st.set_page_config(page_title="Germany Renewable Energy", layout="wide")
 
 
+@st.cache_resource
+def get_session():
+    """Pooled HTTP session shared across reruns"""
+    # Retries back off on timeouts and gateway errors
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(total=3, backoff_factor=2, status_forcelist=[502, 503, 504]),
+    ))
+    return session
+
+
+# ENTSOE XML tags in Clark notation, matched directly without namespace lookups
+NS_URI = "urn:iec62325.351:tc57wg16:451-6:generationloaddocument:3:0"
+TAG_TS = f"{{{NS_URI}}}TimeSeries"
+TAG_PSR = f"{{{NS_URI}}}psrType"
+TAG_PERIOD = f"{{{NS_URI}}}Period"
+TAG_POINT = f"{{{NS_URI}}}Point"
+TAG_QTY = f"{{{NS_URI}}}quantity"
+TAG_POS = f"{{{NS_URI}}}position"
+
+# Parser options: drop whitespace-only text nodes, skip the ID table, allow large documents
+XML_PARSE_OPTIONS = {"remove_blank_text": True, "collect_ids": False, "huge_tree": True}
+
+# Renewable sources: biomass, hydro, solar, wind, etc.
+RENEWABLES = frozenset({"B01", "B09", "B11", "B12", "B15", "B16", "B17", "B18", "B19"})
+
+
+def parse_yyyymmdd(date_str):
+    """Parse a YYYYMMDD string without going through strptime"""
+    return datetime(int(date_str[:4]), int(date_str[4:6]), int(date_str[6:8]))
+
+
 # =============================================================================
 # Fetch renewable generation from ENTSOE
 # =============================================================================
 
-@st.cache_data(ttl=3600)
-def get_entsoe_data(date_str):
+def get_entsoe_data(session, date_str):
     """Get renewable energy generation for a specific day"""
 
     api_key = os.getenv("ENTSOE_API_KEY")
@@ -36,83 +74,84 @@ def get_entsoe_data(date_str):
         "periodEnd": f"{date_str}2359",
     }
 
-    # Retry up to 3 times if timeout
-    for attempt in range(3):
-        try:
-            response = requests.get("https://web-api.tp.entsoe.eu/api", params=params, timeout=120)
-            response.raise_for_status()
-            break
-        except requests.exceptions.Timeout:
-            if attempt == 2:  # Last attempt
-                raise
-            time.sleep(2)  # Wait before retry
-
-    xml_data = ET.fromstring(response.content)
-    namespace = {"ns": "urn:iec62325.351:tc57wg16:451-6:generationloaddocument:3:0"}
-
-    # Renewable sources: biomass, hydro, solar, wind, etc.
-    renewables = ["B01", "B09", "B11", "B12", "B15", "B16", "B17", "B18", "B19"]
-
     # Collect all 15-min MW values (ordered by position)
     # Position 1 = 00:00, Position 2 = 00:15, etc.
-    all_values = []
-    day_start = datetime.strptime(date_str, "%Y%m%d")
-
-    for time_series in xml_data.findall(".//ns:TimeSeries", namespace):
-        energy_type = time_series.find(".//ns:psrType", namespace)
-
-        if energy_type is not None and energy_type.text in renewables:
-            period = time_series.find(".//ns:Period", namespace)
-            if period is not None:
-                for data_point in period.findall(".//ns:Point", namespace):
-                    power_value = float(data_point.find("ns:quantity", namespace).text)
-                    position = int(data_point.find("ns:position", namespace).text)
-                    # Calculate timestamp
-                    timestamp = day_start + timedelta(minutes=15 * (position - 1))
-                    all_values.append((timestamp, power_value))
-
-    # Sort by timestamp
-    all_values.sort()
-    last_time = all_values[-1][0] if all_values else datetime.now()
+    positions = array("q")
+    values = array("d")
+    day_start = np.datetime64(parse_yyyymmdd(date_str), "s")
+
+    # Request a gzip body and decompress it straight into the parser, so the
+    # full XML never sits in memory as a single bytes object. The with-block
+    # returns the pooled connection even when the status check or parse fails.
+    with session.get("https://web-api.tp.entsoe.eu/api", params=params,
+                     headers={"Accept-Encoding": "gzip"}, timeout=120, stream=True) as response:
+        response.raise_for_status()
+        response.raw.decode_content = True
+
+        # Stream the document and process each TimeSeries as soon as it is complete
+        for _event, time_series in etree.iterparse(response.raw, events=("end",), tag=TAG_TS,
+                                                   **XML_PARSE_OPTIONS):
+            energy_type = next(time_series.iter(TAG_PSR), None)
+
+            if energy_type is not None and energy_type.text in RENEWABLES:
+                period = time_series.find(TAG_PERIOD)
+                if period is not None:
+                    for data_point in period.iter(TAG_POINT):
+                        values.append(float(data_point.findtext(TAG_QTY)))
+                        positions.append(int(data_point.findtext(TAG_POS)))
+
+            # Free the processed series and the siblings before it
+            time_series.clear()
+            while time_series.getprevious() is not None:
+                del time_series.getparent()[0]
+
+    # Sum all renewable sources per 15-min slot, then derive one timestamp per slot
+    positions = np.frombuffer(positions, dtype=np.int64)
+    values = np.bincount(positions - 1, weights=np.frombuffer(values, dtype=np.float64))
+    timestamps = day_start + np.arange(len(values)) * np.timedelta64(15, "m")
+    last_time = str(timestamps[-1]) if len(timestamps) else datetime.now().isoformat(timespec="seconds")
 
     return {
-        "data_points": all_values,  # List of (timestamp, MW)
-        "last_datapoint": last_time
+        "timestamps": timestamps,  # datetime64 array
+        "values": values,          # MW, parallel to timestamps
+        "last_datapoint": last_time  # ISO string
     }
 
 
-@st.cache_data(ttl=3600)
-def get_smard_data(date_str):
+def get_smard_data(session, date_str):
     """Get electricity consumption for a specific day"""
 
-    day = datetime.strptime(date_str, "%Y%m%d")
+    day = parse_yyyymmdd(date_str)
 
     # Get latest available data block
     index_url = "https://www.smard.de/app/chart_data/410/DE/index_hour.json"
-    timestamps = requests.get(index_url, timeout=30).json()["timestamps"]
+    timestamps = orjson.loads(session.get(index_url, timeout=30).content)["timestamps"]
     latest = timestamps[-1]
 
     # Fetch consumption data
     url = f"https://www.smard.de/app/chart_data/410/DE/410_DE_hour_{latest}.json"
-    data = requests.get(url, timeout=30).json()["series"]
+    data = orjson.loads(session.get(url, timeout=30).content)["series"]
 
     # Filter to today (SMARD uses millisecond timestamps)
     midnight = day.replace(hour=0, minute=0, second=0, microsecond=0)
     start_ms = int(midnight.timestamp() * 1000)
     end_ms = start_ms + (24 * 3600 * 1000)
 
-    points = []
-    for timestamp_ms, value in data:
-        if start_ms <= timestamp_ms < end_ms and value is not None:
-            time = datetime.fromtimestamp(timestamp_ms / 1000)
-            points.append((time, value))  # (timestamp, MWh)
+    # Missing values (None) become NaN and are masked out with the date filter
+    series = np.asarray(data, dtype=np.float64).reshape(-1, 2)
+    timestamps_ms, values = series[:, 0], series[:, 1]
+    mask = (timestamps_ms >= start_ms) & (timestamps_ms < end_ms) & ~np.isnan(values)
 
-    points.sort()
-    last_time = points[-1][0] if points else datetime.now()
+    # Local wall-clock time per kept row (at most 24), so DST changeovers stay correct
+    timestamps = np.array([datetime.fromtimestamp(t / 1000) for t in timestamps_ms[mask]],
+                          dtype="datetime64[s]")
+    values = values[mask]
+    last_time = str(timestamps[-1]) if len(timestamps) else datetime.now().isoformat(timespec="seconds")
 
     return {
-        "data_points": points,  # List of (timestamp, MWh)
-        "last_datapoint": last_time
+        "timestamps": timestamps,  # datetime64 array
+        "values": values,          # MWh, parallel to timestamps
+        "last_datapoint": last_time  # ISO string
     }
 
 
@@ -120,8 +159,7 @@ def get_smard_data(date_str):
 # Fetch weather conditions from Open-Meteo
 # =============================================================================
 
-@st.cache_data(ttl=3600)
-def get_weather_data(date_str):
+def get_weather_data(session, date_str):
     """Get average weather across Germany for a specific day"""
 
     # Five cities representing different parts of Germany
@@ -133,18 +171,21 @@ def get_weather_data(date_str):
         "Freiburg": (47.99, 7.85),
     }
 
-    sun_hours_list = []
-    wind_speeds_list = []
+    # One request for all cities; Open-Meteo answers with a list, one entry per location
+    latitudes = ",".join(str(lat) for lat, _ in cities.values())
+    longitudes = ",".join(str(lon) for _, lon in cities.values())
+    url = (f"https://api.open-meteo.com/v1/forecast?"
+           f"latitude={latitudes}&longitude={longitudes}"
+           f"&daily=sunshine_duration,wind_speed_10m_max"
+           f"&timezone=Europe/Berlin"
+           f"&start_date={date_str}&end_date={date_str}")
 
-    for city, (lat, lon) in cities.items():
-        url = (f"https://api.open-meteo.com/v1/forecast?"
-               f"latitude={lat}&longitude={lon}"
-               f"&daily=sunshine_duration,wind_speed_10m_max"
-               f"&timezone=Europe/Berlin"
-               f"&start_date={date_str}&end_date={date_str}")
+    results = session.get(url).json()
 
-        result = requests.get(url).json()
+    sun_hours_list = []
+    wind_speeds_list = []
 
+    for result in results:
         if "daily" in result:
             sun_hours_list.append(result["daily"]["sunshine_duration"][0] / 3600)
             wind_speeds_list.append(result["daily"]["wind_speed_10m_max"][0])
@@ -155,11 +196,43 @@ def get_weather_data(date_str):
     }
 
 
+# =============================================================================
+# Fetch all sources concurrently
+# =============================================================================
+
+@st.cache_data(ttl=3600)
+def get_all_data(date_str):
+    """Get generation, consumption and weather for a specific day in parallel"""
+
+    day = parse_yyyymmdd(date_str)
+
+    # Resolved here on the script thread; the workers below make no Streamlit calls
+    session = get_session()
+
+    # Independent network calls, so wall time is the slowest source instead of the sum
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        generation = executor.submit(get_entsoe_data, session, date_str)
+        consumption = executor.submit(get_smard_data, session, date_str)
+        weather = executor.submit(get_weather_data, session, day.strftime("%Y-%m-%d"))
+        return generation.result(), consumption.result(), weather.result()
+
+
+# =============================================================================
+# Public holidays
+# =============================================================================
+
+@st.cache_data(ttl=86400)
+def get_holiday_ordinals(year):
+    """Berlin public holidays of a year as a set of date ordinals"""
+    return frozenset(day.toordinal() for day in holidays.Germany(prov="BE", years=year))
+
+
 # =============================================================================
 # Page styling
 # =============================================================================
 
-st.markdown("""
+# Shipped together with the header below, so the page starts with one markdown element
+PAGE_STYLE = """
 <style>
     * { font-family: 'Times New Roman', Times, serif !important; }
     .main .block-container { text-align: center; }
@@ -171,190 +244,203 @@ st.markdown("""
         color: #6b7280; cursor: pointer;
     }
     .tiny-button button:hover { background-color: #f3f4f6; }
+    .centered { max-width: 66%; margin-left: auto; margin-right: auto; }
+    hr.divider { max-width: 66%; margin: 2em auto; border: none; border-top: 1px solid #e5e7eb; }
+    .pbar { display: block; width: 100%; height: 30px; border-radius: 5px; overflow: hidden; }
+    .pbar line { stroke: #000000; stroke-width: 1px; vector-effect: non-scaling-stroke; }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Colored arrows (green = good, red = bad)
+ARROW_UP = "<span style='color: #00674F;'>↑</span>"
+ARROW_DOWN = "<span style='color: #DC2626;'>↓</span>"
+
+# Day type by (is_weekend, is_holiday); holidays win over weekends
+DAY_LABELS = {
+    (False, False): ("Working Day", ARROW_DOWN, "higher demand"),
+    (True, False): ("Weekend", ARROW_UP, "lower demand"),
+    (False, True): ("Holiday", ARROW_UP, "lower demand"),
+    (True, True): ("Holiday", ARROW_UP, "lower demand"),
+}
+
+# Fixed milestones (2000, 2010, 2020, 2030 target) are prebuilt; only this year's marks change
+BAR_TICKS_HEAD = """\
+        <line x1="0.1" x2="0.1" y1="0" y2="30"/>
+        <line x1="6" x2="6" y1="0" y2="30"/>
+        <line x1="20" x2="20" y1="0" y2="30"/>
+        <line x1="50" x2="50" y1="0" y2="30"/>"""
+BAR_TICKS_TAIL = """\
+        <line x1="80" x2="80" y1="0" y2="30"/>
+        <line x1="99.9" x2="99.9" y1="0" y2="30"/>"""
+TIMELINE_HEAD = """\
+    <div style="position: relative; width: 100%; height: 80px; margin-top: 21px;">
+        <span style="position: absolute; left: 0%; transform: translateX(-50%); text-align: center;"><b>0%</b></span>
+        <span style="position: absolute; left: 6%; transform: translateX(-50%); text-align: center;"><b>6%</b><br>2000</span>
+        <span style="position: absolute; left: 20%; transform: translateX(-50%); text-align: center;"><b>20%</b><br>2010</span>
+        <span style="position: absolute; left: 50%; transform: translateX(-50%); text-align: center;"><b>50%</b><br>2020</span>"""
+TIMELINE_TAIL = """\
+        <span style="position: absolute; left: 80%; transform: translateX(-50%); text-align: center;"><b>80%</b><br>2030<br><span style="color: #EFCF50;">EEG Target</span></span>
+        <span style="position: absolute; right: 0%; transform: translateX(50%); text-align: center;"><b>100%</b></span>
+    </div>"""
 
 
 # =============================================================================
 # Header
 # =============================================================================
 
-st.title("⚡️ Renewables 🇩🇪")
-st.markdown("<p style='text-align: center; margin-top: -20px;'>(% of consumption)</p>",
+st.markdown(PAGE_STYLE +
+            "<h1>⚡️ Renewables 🇩🇪</h1>"
+            "<p style='text-align: center; margin-top: -4px;'>(% of consumption)</p>"
+            "<hr class='divider'>",
             unsafe_allow_html=True)
 
-_left, divider, _right = st.columns([1, 4, 1])
-with divider:
-    st.divider()
-
 
 # =============================================================================
-# Load today's data
+# Live data (today, progress and data timestamp)
 # =============================================================================
 
-today = datetime.now()
-today_str = today.strftime("%Y-%m-%d")
-today_date_str = today.strftime("%Y%m%d")
+@st.fragment(run_every="1h")
+def live_dashboard():
+    """Everything derived from the fetched data; reruns on its own every hour"""
 
-# Fetch data (all cached for 1 hour)
-generation_data = get_entsoe_data(today_date_str)
-consumption_data = get_smard_data(today_date_str)
-weather = get_weather_data(today_str)
+    # =========================================================================
+    # Load today's data
+    # =========================================================================
 
-# Find bottleneck (earliest timestamp where we have BOTH datasets)
-gen_last = generation_data["last_datapoint"]
-cons_last = consumption_data["last_datapoint"]
-bottleneck = min(gen_last, cons_last)
+    # Read the clock once; every date-derived value below comes from this
+    today = datetime.now()
+    today_date_str = today.strftime("%Y%m%d")
 
-# Filter both datasets to only use overlapping time period
-gen_points = [(t, mw) for t, mw in generation_data["data_points"] if t <= bottleneck]
-cons_points = [(t, mwh) for t, mwh in consumption_data["data_points"] if t <= bottleneck]
+    # Fetch data (all cached for 1 hour)
+    generation_data, consumption_data, weather = get_all_data(today_date_str)
 
-# Calculate totals
-renewable_MWh = sum([mw * 0.25 for _, mw in gen_points])  # Convert MW to MWh
-consumption_MWh = sum([mwh for _, mwh in cons_points])
-todays_renewable_share = (renewable_MWh / consumption_MWh * 100) if consumption_MWh > 0 else 0
-last_data_time = bottleneck
+    # Find bottleneck (earliest timestamp where we have BOTH datasets)
+    gen_last = datetime.fromisoformat(generation_data["last_datapoint"])
+    cons_last = datetime.fromisoformat(consumption_data["last_datapoint"])
+    bottleneck = min(gen_last, cons_last)
 
-# Check if today is a holiday
-berlin_holidays = holidays.Germany(prov="BE", years=today.year)
-is_holiday = today.date() in berlin_holidays
+    # Filter both datasets to only use overlapping time period
+    cutoff = np.datetime64(bottleneck)
+    gen_mask = generation_data["timestamps"] <= cutoff
+    cons_mask = consumption_data["timestamps"] <= cutoff
 
+    # Calculate totals
+    renewable_MWh = generation_data["values"][gen_mask].sum() * 0.25  # Convert MW to MWh
+    consumption_MWh = consumption_data["values"][cons_mask].sum()
+    todays_renewable_share = (renewable_MWh / consumption_MWh * 100) if consumption_MWh > 0 else 0
+    last_data_time = bottleneck
 
-# =============================================================================
-# Compare to yearly averages
-# =============================================================================
-
-current_year = today.year
+    # Check if today is a holiday
+    is_holiday = today.toordinal() in get_holiday_ordinals(today.year)
+    is_weekend = today.weekday() >= 5
 
-# Hardcoded 2025 average
-yearly_renewable_avg = 61
+    # =========================================================================
+    # Compare to yearly averages
+    # =========================================================================
 
-# Typical German weather
-yearly_sun_avg = 4.7    # hours per day
-yearly_wind_avg = 12.5  # km/h
+    current_year = today.year
 
-# Today vs average
-renewable_diff = todays_renewable_share - yearly_renewable_avg
-sun_diff = weather["sun_hours"] - yearly_sun_avg
-wind_diff = weather["wind_speed"] - yearly_wind_avg
+    # Hardcoded 2025 average
+    yearly_renewable_avg = 61
 
-# Colored arrows (green = good, red = bad)
-def arrow(diff):
-    return "<span style='color: #00674F;'>↑</span>" if diff > 0 else "<span style='color: #DC2626;'>↓</span>"
+    # Typical German weather
+    yearly_sun_avg = 4.7    # hours per day
+    yearly_wind_avg = 12.5  # km/h
 
-renewable_arrow = arrow(renewable_diff)
-sun_arrow = arrow(sun_diff)
-wind_arrow = arrow(wind_diff)
+    # Today vs average
+    diffs = (todays_renewable_share - yearly_renewable_avg,
+             weather["sun_hours"] - yearly_sun_avg,
+             weather["wind_speed"] - yearly_wind_avg)
+    renewable_diff, sun_diff, wind_diff = diffs
 
+    # Colored arrows (green = good, red = bad)
+    renewable_arrow, sun_arrow, wind_arrow = (ARROW_UP if diff > 0 else ARROW_DOWN for diff in diffs)
 
-# =============================================================================
-# Today section
-# =============================================================================
+    # =========================================================================
+    # Today section
+    # =========================================================================
 
-st.markdown("<h2 style='text-align: center;'>Today</h2>", unsafe_allow_html=True)
+    st.markdown("<h2 style='text-align: center;'>Today</h2>", unsafe_allow_html=True)
 
-left_col, right_col = st.columns([1, 1])
+    left_col, right_col = st.columns([1, 1])
 
-# Show today's percentage
-with left_col:
-    st.markdown(f"""
-    <div style='display: flex; justify-content: flex-end;'>
-        <div style='text-align: center;'>
-            <h1 style='font-size: 80px; margin: 0; margin-top: -30px;'>{todays_renewable_share:.1f}%</h1>
-            <p style='margin: 0; margin-top: -10px;'><i>{renewable_arrow} {abs(renewable_diff):.1f}% {'above' if renewable_diff > 0 else 'below'} avg</i></p>
+    # Show today's percentage
+    with left_col:
+        st.markdown(f"""
+        <div style='display: flex; justify-content: flex-end;'>
+            <div style='text-align: center;'>
+                <h1 style='font-size: 80px; margin: 0; margin-top: -30px;'>{todays_renewable_share:.1f}%</h1>
+                <p style='margin: 0; margin-top: -10px;'><i>{renewable_arrow} {abs(renewable_diff):.1f}% {'above' if renewable_diff > 0 else 'below'} avg</i></p>
+            </div>
         </div>
+        """, unsafe_allow_html=True)
+
+    # Show weather and day type
+    with right_col:
+        # Day type (affects electricity demand)
+        day_type, day_arrow, demand = DAY_LABELS[(is_weekend, is_holiday)]
+
+        # One element for all three lines; margins stand in for the gap between elements
+        st.markdown(f"<div style='text-align: left;'>"
+                    f"☀️ Sun {weather['sun_hours']:.1f} h  {sun_arrow} {abs(sun_diff):.1f} h {'above' if sun_diff > 0 else 'below'} avg"
+                    f"</div>"
+                    f"<div style='text-align: left; margin-top: 36px;'>"
+                    f"💨 Wind {weather['wind_speed']:.1f} km/h  {wind_arrow} {abs(wind_diff):.1f} km/h {'above' if wind_diff > 0 else 'below'} avg"
+                    f"</div>"
+                    f"<div style='text-align: left; margin-top: 36px;'>"
+                    f"📅 {day_type} {day_arrow} {demand}"
+                    f"</div>", unsafe_allow_html=True)
+
+    # =========================================================================
+    # Historical progress
+    # =========================================================================
+
+    # Load this year's average
+    this_year_avg = yearly_renewable_avg  # Already loaded above
+
+    # Progress toward 2030 target
+    target_2030 = 80.0
+    years_left = 2030 - current_year
+    label_pos = (this_year_avg + target_2030) / 2
+
+    # Two-color progress bar (green = achieved, yellow = remaining) drawn as one SVG,
+    # with timeline labels below, centered by CSS instead of a column row
+    st.markdown(f"""
+    <br><br>
+    <div class="centered">
+        <svg class="pbar" viewBox="0 0 100 30" preserveAspectRatio="none">
+            <rect width="100" height="30" fill="#e5e7eb"/>
+            <rect width="{this_year_avg}" height="30" fill="#00674F"/>
+            <rect x="{this_year_avg}" width="{target_2030 - this_year_avg}" height="30" fill="#EFCF50"/>
+    {BAR_TICKS_HEAD}
+            <line x1="{this_year_avg}" x2="{this_year_avg}" y1="0" y2="30"/>
+    {BAR_TICKS_TAIL}
+        </svg>
+    {TIMELINE_HEAD}
+            <span style="position: absolute; left: {this_year_avg}%; transform: translateX(-50%); text-align: center;"><b>{int(this_year_avg)}%</b><br>{current_year}<br><b style="font-size: 36px; color: #00674F;">⬆</b></span>
+            <span style="position: absolute; left: {label_pos}%; transform: translateX(-50%); text-align: center; color: #EFCF50;">{years_left} years to reach target</span>
+    {TIMELINE_TAIL}
     </div>
     """, unsafe_allow_html=True)
 
-# Show weather and day type
-with right_col:
-    st.markdown(f"<div style='text-align: left;'>"
-                f"☀️ Sun {weather['sun_hours']:.1f} h  {sun_arrow} {abs(sun_diff):.1f} h {'above' if sun_diff > 0 else 'below'} avg"
-                f"</div>", unsafe_allow_html=True)
-
-    st.markdown(f"<div style='text-align: left; margin-top: 20px;'>"
-                f"💨 Wind {weather['wind_speed']:.1f} km/h  {wind_arrow} {abs(wind_diff):.1f} km/h {'above' if wind_diff > 0 else 'below'} avg"
-                f"</div>", unsafe_allow_html=True)
-
-    # Day type (affects electricity demand)
-    is_weekend = today.weekday() >= 5
-    if is_holiday:
-        day_type, day_arrow, demand = "Holiday", "↑", "lower demand"
-    elif is_weekend:
-        day_type, day_arrow, demand = "Weekend", "↑", "lower demand"
-    else:
-        day_type, day_arrow, demand = "Working Day", "↓", "higher demand"
-
-    arrow_color = "#00674F" if day_arrow == "↑" else "#DC2626"
-    st.markdown(f"<div style='text-align: left; margin-top: 20px;'>"
-                f"📅 {day_type} <span style='color: {arrow_color};'>{day_arrow}</span> {demand}"
-                f"</div>", unsafe_allow_html=True)
-
-
-# =============================================================================
-# Historical progress
-# =============================================================================
-
-st.markdown("<br><br>", unsafe_allow_html=True)
+    # =========================================================================
+    # Last available data
+    # =========================================================================
 
-# Load this year's average
-this_year_avg = yearly_renewable_avg  # Already loaded above
+    # Show last available data timestamp below a divider
+    last_data_str = last_data_time.strftime("%H:%M, %B %d, %Y")
+    st.markdown(f"<hr class='divider'>"
+                f"<p style='text-align: center; margin-bottom: 5px;'><i>🕒 Last available data: {last_data_str}</i></p>",
+                unsafe_allow_html=True)
 
-# Progress toward 2030 target
-target_2030 = 80.0
-years_left = 2030 - current_year
-label_pos = (this_year_avg + target_2030) / 2
 
-# Progress bar row
-_left, bar_area, _right = st.columns([1, 4, 1])
-
-with bar_area:
-    # Two-color progress bar (green = achieved, yellow = remaining)
-    st.markdown(f"""
-    <div style="width: 100%; height: 30px; background-color: #e5e7eb; border-radius: 5px; overflow: hidden; position: relative;">
-        <div style="width: {this_year_avg}%; height: 100%; background-color: #00674F; float: left;"></div>
-        <div style="width: {target_2030 - this_year_avg}%; height: 100%; background-color: #EFCF50; float: left;"></div>
-        <div style="position: absolute; left: 0%; top: 0; width: 1px; height: 30px; background-color: #000000;"></div>
-        <div style="position: absolute; left: 6%; top: 0; width: 1px; height: 30px; background-color: #000000;"></div>
-        <div style="position: absolute; left: 20%; top: 0; width: 1px; height: 30px; background-color: #000000;"></div>
-        <div style="position: absolute; left: 50%; top: 0; width: 1px; height: 30px; background-color: #000000;"></div>
-        <div style="position: absolute; left: {this_year_avg}%; top: 0; width: 1px; height: 30px; background-color: #000000;"></div>
-        <div style="position: absolute; left: 80%; top: 0; width: 1px; height: 30px; background-color: #000000;"></div>
-        <div style="position: absolute; right: 0%; top: 0; width: 1px; height: 30px; background-color: #000000;"></div>
-    </div>
-    """, unsafe_allow_html=True)
-
-# Timeline labels
-_left2, labels_area, _right2 = st.columns([1, 4, 1])
-with labels_area:
-    st.markdown(f"""
-    <div style="position: relative; width: 100%; height: 80px; margin-top: 5px;">
-        <span style="position: absolute; left: 0%; transform: translateX(-50%); text-align: center;"><b>0%</b></span>
-        <span style="position: absolute; left: 6%; transform: translateX(-50%); text-align: center;"><b>6%</b><br>2000</span>
-        <span style="position: absolute; left: 20%; transform: translateX(-50%); text-align: center;"><b>20%</b><br>2010</span>
-        <span style="position: absolute; left: 50%; transform: translateX(-50%); text-align: center;"><b>50%</b><br>2020</span>
-        <span style="position: absolute; left: {this_year_avg}%; transform: translateX(-50%); text-align: center;"><b>{int(this_year_avg)}%</b><br>{current_year}<br><b style="font-size: 36px; color: #00674F;">⬆</b></span>
-        <span style="position: absolute; left: {label_pos}%; transform: translateX(-50%); text-align: center; color: #EFCF50;">{years_left} years to reach target</span>
-        <span style="position: absolute; left: 80%; transform: translateX(-50%); text-align: center;"><b>80%</b><br>2030<br><span style="color: #EFCF50;">EEG Target</span></span>
-        <span style="position: absolute; right: 0%; transform: translateX(50%); text-align: center;"><b>100%</b></span>
-    </div>
-    """, unsafe_allow_html=True)
+live_dashboard()
 
 
 # =============================================================================
 # Footer
 # =============================================================================
 
-_left3, divider2, _right3 = st.columns([1, 4, 1])
-with divider2:
-    st.divider()
-
-# Show last available data timestamp
-last_data_str = last_data_time.strftime("%H:%M, %B %d, %Y")
-st.markdown(f"<p style='text-align: center; margin-bottom: 5px;'><i>🕒 Last available data: {last_data_str}</i></p>",
-            unsafe_allow_html=True)
-
 # Sources and update button
 sources_left, sources_center, button_right = st.columns([1, 4, 1])
 
@@ -367,8 +453,6 @@ with button_right:
     st.markdown('<div class="tiny-button">', unsafe_allow_html=True)
     if st.button("🔄 Update", key="update_today"):
         # Clear cache and force refresh of today's data
-        get_entsoe_data.clear()
-        get_smard_data.clear()
-        get_weather_data.clear()
+        get_all_data.clear()
         st.rerun()
     st.markdown('</div>', unsafe_allow_html=True)  # Close tiny-button div